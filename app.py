@@ -1,66 +1,254 @@
+import io
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
-
-# === Load dan preprocessing data ===
-df = pd.read_csv("Data/data_supplier.csv")
 
-# Konversi harga dari USD ke IDR
-usd_to_idr = 16000
-df['Unit_Price'] = df['Unit_Price'] * usd_to_idr
-df['Negotiated_Price'] = df['Negotiated_Price'] * usd_to_idr
+# Numba opsional: dipakai untuk agregasi satu-pass jika hasil filter besar
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
-# Ubah kolom tanggal menjadi format datetime
-df['Order_Date'] = pd.to_datetime(df['Order_Date'])
-df['Delivery_Date'] = pd.to_datetime(df['Delivery_Date'])
+# Polars opsional: kalau terpasang, seluruh query rekomendasi dijalankan
+# di engine kolumnar multi-thread-nya
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
 
-# Hitung Lead Time (untuk yang lengkap dulu)
-df['Lead_Time'] = (df['Delivery_Date'] - df['Order_Date']).dt.days
-mean_lead_time = df.dropna(subset=['Delivery_Date']).groupby('Supplier')['Lead_Time'].mean()
+# Di bawah ini groupby pandas masih lebih cepat (overhead kompilasi/dispatch)
+_NUMBA_MIN_ROWS = 10_000
 
-# Imputasi nilai kosong pada Delivery_Date
-def isi_delivery_date(row):
-    if pd.isnull(row['Delivery_Date']) and row['Supplier'] in mean_lead_time:
-        return row['Order_Date'] + pd.to_timedelta(round(mean_lead_time[row['Supplier']]), unit='D')
+# === Load dan preprocessing data ===
+# Di-cache supaya load + preprocessing tidak diulang setiap rerun Streamlit
+@st.cache_data
+def load_data(path: str, usd_to_idr: int) -> pd.DataFrame:
+    # Parquet (hasil convert_to_parquet.py) sudah menyimpan tipe kolom dan
+    # tanggal secara native, jadi tidak perlu parsing CSV + pd.to_datetime lagi
+    df = pd.read_parquet(
+        path,
+        engine="pyarrow",
+        columns=[
+            'PO_ID', 'Supplier', 'Order_Date', 'Delivery_Date', 'Item_Category',
+            'Order_Status', 'Quantity', 'Unit_Price', 'Negotiated_Price',
+            'Defective_Units', 'Compliance',
+        ],
+    )
+
+    # Konversi harga dari USD ke IDR
+    df['Unit_Price'] = df['Unit_Price'] * usd_to_idr
+    df['Negotiated_Price'] = df['Negotiated_Price'] * usd_to_idr
+
+    # Rata-rata lead time per supplier, dihitung hanya dari baris yang
+    # Delivery_Date-nya terisi; kolom Lead_Time sendiri cukup dihitung
+    # sekali nanti setelah imputasi
+    have_delivery = df['Delivery_Date'].notna()
+    lead_partial = (df.loc[have_delivery, 'Delivery_Date'] - df.loc[have_delivery, 'Order_Date']).dt.days
+    mean_lead_time = lead_partial.groupby(df.loc[have_delivery, 'Supplier'], observed=True, sort=False).mean()
+
+    # Imputasi nilai kosong pada Delivery_Date:
+    # Order_Date + rata-rata lead time per supplier (vectorized, tanpa apply per baris)
+    lead_days = df['Supplier'].map(mean_lead_time).round()
+    imputed = df['Order_Date'] + pd.to_timedelta(lead_days, unit='D')
+    df['Delivery_Date'] = df['Delivery_Date'].fillna(imputed)
+
+    # Imputasi Defective_Units = 0 jika kosong
+    df['Defective_Units'] = df['Defective_Units'].fillna(0)
+
+    # Hitung kolom turunan setelah imputasi
+    df['Lead_Time'] = (df['Delivery_Date'] - df['Order_Date']).dt.days
+    q = df['Quantity'].to_numpy()
+    d = df['Defective_Units'].to_numpy()
+    df['Defect_Rate'] = np.where(q != 0, d / np.where(q == 0, 1, q) * 100, 0.0)
+    df['Price_Efficiency'] = (1 - df['Negotiated_Price'] / df['Unit_Price']) * 100
+
+    # Downcast kolom hitungan: int64/float64 bawaan boros bandwidth untuk
+    # nilai sekecil ini; pastikan dulu tidak ada yang overflow
+    assert df['Quantity'].max() < np.iinfo(np.int32).max
+    assert df['Defective_Units'].max() < np.iinfo(np.int32).max
+    assert df['Lead_Time'].max() < np.iinfo(np.int16).max
+    df['Quantity'] = df['Quantity'].astype('int32')
+    df['Defective_Units'] = df['Defective_Units'].astype('int32')
+    df['Lead_Time'] = df['Lead_Time'].astype('int16')
+
+    # Kolom string berkardinalitas rendah jadi category: groupby/filter bekerja
+    # pada kode integer, bukan objek string
+    for c in ['Supplier', 'Item_Category', 'Compliance', 'Order_Status']:
+        df[c] = df[c].astype('category')
+    # Versi lowercase untuk pencocokan kategori yang case-insensitive
+    df['_ic_lower'] = df['Item_Category'].str.lower().astype('category')
+
+    # Kunci grup komposit: kemas kode Supplier/Item_Category/Compliance ke
+    # satu uint32 supaya groupby cukup meng-hash satu kolom integer
+    assert len(df['Supplier'].cat.categories) < (1 << 16)
+    assert len(df['Item_Category'].cat.categories) < (1 << 8)
+    assert len(df['Compliance'].cat.categories) < (1 << 8)
+    sup = df['Supplier'].cat.codes.to_numpy().astype(np.uint32)
+    ic = df['Item_Category'].cat.codes.to_numpy().astype(np.uint32)
+    co = df['Compliance'].cat.codes.to_numpy().astype(np.uint32)
+    df['_gkey'] = (sup << 16) | (ic << 8) | co
+
+    # Daftar pilihan kategori untuk selectbox, dihitung sekali di sini
+    # supaya tidak scan kolom penuh di setiap rerun
+    item_categories = ["All"] + sorted(df['Item_Category'].dropna().unique().tolist())
+
+    # Urutkan master df berdasarkan Defect_Rate supaya filter paling selektif
+    # bisa pakai binary search (searchsorted) + slice, bukan scan penuh
+    df = df.sort_values('Defect_Rate').reset_index(drop=True)
+
+    # Array NumPy kontigu untuk ketiga filter numerik; float32/int16
+    # memangkas separuh bandwidth dibanding float64 saat masking
+    price_arr = df['Negotiated_Price'].to_numpy(np.float32)
+    lead_arr = df['Lead_Time'].to_numpy(np.int16)
+    defect_arr = df['Defect_Rate'].to_numpy(np.float32)
+    return df, item_categories, price_arr, lead_arr, defect_arr
+
+df, item_categories, _price_arr, _lead_arr, _defect_arr = load_data("Data/data_supplier.parquet", 16000)
+
+# Pemetaan kategori lowercase -> kode integer, untuk filter berbasis kode
+_ic_code = {c: i for i, c in enumerate(df['_ic_lower'].cat.categories)}
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _agg6_kernel(codes, ngroups, price, lead, defect, eff, qty):
+        # Satu pass atas data terfilter: akumulasi sum + count per grup.
+        # Loop serial: akumulator bersama membuat prange tidak aman (race),
+        # dan satu pass native sudah jauh di atas groupby pandas.
+        sums = np.zeros((ngroups, 4))
+        qty_sum = np.zeros(ngroups, dtype=np.int64)
+        counts = np.zeros(ngroups, dtype=np.int64)
+        for i in range(codes.shape[0]):
+            g = codes[i]
+            sums[g, 0] += price[i]
+            sums[g, 1] += lead[i]
+            sums[g, 2] += defect[i]
+            sums[g, 3] += eff[i]
+            qty_sum[g] += qty[i]
+            counts[g] += 1
+        return sums, qty_sum, counts
+
+
+def _aggregate_numba(filtered_df, group_cols):
+    """Agregasi 6 kolom ala groupby.agg, lewat kernel Numba satu-pass."""
+    if len(group_cols) > 1:
+        keys = pd.MultiIndex.from_frame(filtered_df[group_cols])
     else:
-        return row['Delivery_Date']
-
-df['Delivery_Date'] = df.apply(isi_delivery_date, axis=1)
+        keys = pd.Index(filtered_df[group_cols[0]])
+    codes, uniques = pd.factorize(keys, sort=False)
+
+    sums, qty_sum, counts = _agg6_kernel(
+        codes.astype(np.int64),
+        len(uniques),
+        filtered_df['Negotiated_Price'].to_numpy(np.float64),
+        filtered_df['Lead_Time'].to_numpy(np.float64),
+        filtered_df['Defect_Rate'].to_numpy(np.float64),
+        filtered_df['Price_Efficiency'].to_numpy(np.float64),
+        filtered_df['Quantity'].to_numpy(np.int64),
+    )
+
+    agg_part = pd.DataFrame({
+        'Avg_Negotiated_Price': sums[:, 0] / counts,
+        'Lead_Time': sums[:, 1] / counts,
+        'Defect_Rate (%)': sums[:, 2] / counts,
+        'Price_Efficiency (%)': sums[:, 3] / counts,
+        'Total_Quantity': qty_sum,
+        'Total_Orders': counts,
+    }, index=uniques)
+    agg_part.index.names = group_cols
+    return agg_part
+
+
+# === Backend Polars (opsional) ===
+if HAS_POLARS:
+    @st.cache_resource
+    def _get_pl_df():
+        # Konversi sekali per sesi; hanya kolom yang dipakai query
+        return pl.from_pandas(df[[
+            'Supplier', 'Item_Category', 'Compliance', 'Order_Status', 'PO_ID',
+            'Negotiated_Price', 'Lead_Time', 'Defect_Rate', 'Price_Efficiency',
+            'Quantity', '_ic_lower',
+        ]])
+
+    def _recommend_suppliers_pl(item_category, max_price, max_lead_time, max_defect_rate, compliance_preference):
+        """Jalur cepat recommend_suppliers di Polars; hasilnya frame pandas
+        yang identik dengan jalur pandas."""
+        preds = [
+            pl.col('Negotiated_Price') <= max_price,
+            pl.col('Lead_Time') <= max_lead_time,
+            pl.col('Defect_Rate') <= max_defect_rate,
+        ]
+        if item_category != "All":
+            preds.append(pl.col('_ic_lower') == item_category.lower())
+        if compliance_preference in ("Yes", "No"):
+            preds.append(pl.col('Compliance') == compliance_preference)
+
+        filtered = _get_pl_df().lazy().filter(*preds).collect()
+        if filtered.height == 0:
+            return pd.DataFrame()
+
+        group_cols = ['Supplier']
+        if item_category == "All":
+            group_cols.append('Item_Category')
+        if compliance_preference == "All":
+            group_cols.append('Compliance')
+
+        agg_part = filtered.group_by(group_cols).agg(
+            pl.col('Negotiated_Price').mean().alias('Avg_Negotiated_Price'),
+            pl.col('Lead_Time').mean().alias('Lead_Time'),
+            pl.col('Defect_Rate').mean().alias('Defect_Rate (%)'),
+            pl.col('Price_Efficiency').mean().alias('Price_Efficiency (%)'),
+            pl.col('Quantity').sum().alias('Total_Quantity'),
+            pl.col('PO_ID').count().alias('Total_Orders'),
+        )
+        status_part = filtered.group_by(group_cols + ['Order_Status']).len().pivot(
+            on='Order_Status', index=group_cols, values='len').fill_null(0)
 
-# Imputasi Defective_Units = 0 jika kosong
-df['Defective_Units'] = df['Defective_Units'].fillna(0)
+        result = agg_part.join(status_part, on=group_cols, how='left')
+        result = result.sort(['Defect_Rate (%)', 'Lead_Time', 'Avg_Negotiated_Price'])
+        return result.to_pandas()
 
-# Update kolom setelah imputasi
-df['Lead_Time'] = (df['Delivery_Date'] - df['Order_Date']).dt.days
-df['Defect_Rate'] = df.apply(
-    lambda row: (row['Defective_Units'] / row['Quantity']) * 100 if row['Quantity'] != 0 else 0,
-    axis=1
-)
-df['Price_Efficiency'] = (1 - df['Negotiated_Price'] / df['Unit_Price']) * 100
 
 # === Fungsi Rekomendasi Supplier ===
+# Di-cache berdasarkan kelima argumen filter, jadi pencarian dengan kriteria
+# yang sama tidak menghitung ulang
+@st.cache_data(show_spinner=False)
 def recommend_suppliers(item_category, max_price, max_lead_time, max_defect_rate, compliance_preference="All"):
-    filtered_df = df.copy()
+    if HAS_POLARS:
+        return _recommend_suppliers_pl(item_category, max_price, max_lead_time,
+                                       max_defect_rate, compliance_preference)
+
+    # Defect_Rate sudah terurut naik (diurutkan di loader): binary search
+    # menentukan batas atas, filter lain cukup bekerja pada irisan [:cut]
+    cut = int(np.searchsorted(_defect_arr, max_defect_rate, side='right'))
+    if cut == 0:
+        return pd.DataFrame()
+
+    # Satu mask gabungan lalu sekali pengindeksan, tanpa copy penuh per filter
+    mask = np.ones(cut, dtype=bool)
 
     if item_category != "All":
-        filtered_df = filtered_df[filtered_df['Item_Category'].str.lower() == item_category.lower()]
+        # Bandingkan kode kategori (integer), bukan string; -2 = tidak ada
+        # yang cocok (kode -1 dipakai pandas untuk NaN)
+        code = _ic_code.get(item_category.lower(), -2)
+        mask &= df['_ic_lower'].cat.codes.to_numpy()[:cut] == code
 
     if compliance_preference == "Yes":
-        filtered_df = filtered_df[filtered_df['Compliance'] == 'Yes']
+        mask &= (df['Compliance'].iloc[:cut] == 'Yes').to_numpy()
     elif compliance_preference == "No":
-        filtered_df = filtered_df[filtered_df['Compliance'] == 'No']
+        mask &= (df['Compliance'].iloc[:cut] == 'No').to_numpy()
+
+    mask &= _price_arr[:cut] <= max_price
+    mask &= _lead_arr[:cut] <= max_lead_time
 
-    filtered_df = filtered_df[
-        (filtered_df['Negotiated_Price'] <= max_price) &
-        (filtered_df['Lead_Time'] <= max_lead_time) &
-        (filtered_df['Defect_Rate'] <= max_defect_rate)
-    ]
+    filtered_df = df.iloc[:cut][mask]
 
     if filtered_df.empty:
         return pd.DataFrame()
 
-    group_cols = ['Supplier']
     agg_dict = {
         'Negotiated_Price': 'mean',
         'Lead_Time': 'mean',
@@ -70,42 +258,92 @@ def recommend_suppliers(item_category, max_price, max_lead_time, max_defect_rate
         'PO_ID': 'count'
     }
 
-    # Jika user memilih "All", tambahkan kolom ke hasil agregasi
+    # Group cukup pada _gkey (kode terkemas): dimensi yang difilter spesifik
+    # bernilai konstan di filtered_df, jadi partisinya identik dengan
+    # groupby multi-kolom
+    if HAS_NUMBA and len(filtered_df) >= _NUMBA_MIN_ROWS:
+        agg_part = _aggregate_numba(filtered_df, ['_gkey'])
+    else:
+        agg_part = filtered_df.groupby('_gkey', observed=True, sort=False).agg(agg_dict).rename(columns={
+            'Negotiated_Price': 'Avg_Negotiated_Price',
+            'Defect_Rate': 'Defect_Rate (%)',
+            'Price_Efficiency': 'Price_Efficiency (%)',
+            'Quantity': 'Total_Quantity',
+            'PO_ID': 'Total_Orders'
+        })
+
+    # Hitung status PO (Open/Closed) lewat groupby pada kunci yang sama,
+    # menggantikan pasangan crosstab + merge yang meng-hash kunci dua kali
+    status_part = (
+        filtered_df.groupby(['_gkey', 'Order_Status'], observed=True, sort=False)
+        .size()
+        .unstack('Order_Status', fill_value=0)
+    )
+
+    # Kedua frame ber-index _gkey yang sama persis: cukup concat selaras
+    # index, tanpa hash-join
+    result = pd.concat([agg_part, status_part], axis=1).reset_index()
+
+    # Uraikan _gkey kembali menjadi kolom kategori; dimensi yang difilter
+    # spesifik ("All" tidak dipilih) tidak perlu ditampilkan
+    keys = result.pop('_gkey').to_numpy()
+    result.insert(0, 'Supplier',
+                  pd.Categorical.from_codes((keys >> 16).astype(np.intp), dtype=df['Supplier'].dtype))
+    pos = 1
     if item_category == "All":
-        group_cols.append('Item_Category')
+        result.insert(pos, 'Item_Category',
+                      pd.Categorical.from_codes(((keys >> 8) & 0xFF).astype(np.intp), dtype=df['Item_Category'].dtype))
+        pos += 1
     if compliance_preference == "All":
-        group_cols.append('Compliance')
-
-    result = filtered_df.groupby(group_cols).agg(agg_dict).rename(columns={
-        'Negotiated_Price': 'Avg_Negotiated_Price',
-        'Defect_Rate': 'Defect_Rate (%)',
-        'Price_Efficiency': 'Price_Efficiency (%)',
-        'Quantity': 'Total_Quantity',
-        'PO_ID': 'Total_Orders'
-    }).reset_index()
-
-    # Gabungkan dengan status PO (Open/Closed)
-    status_counts = pd.crosstab(
-        [filtered_df['Supplier']] + (
-            [filtered_df['Item_Category']] if item_category == "All" else []
-        ) + (
-            [filtered_df['Compliance']] if compliance_preference == "All" else []
-        ),
-        filtered_df['Order_Status']
-    ).reset_index()
-
-    result = pd.merge(result, status_counts, on=group_cols, how='left')
+        result.insert(pos, 'Compliance',
+                      pd.Categorical.from_codes((keys & 0xFF).astype(np.intp), dtype=df['Compliance'].dtype))
 
     # Urutkan
     result = result.sort_values(by=['Defect_Rate (%)', 'Lead_Time', 'Avg_Negotiated_Price'])
     return result
 
+# CSV download di-cache per hasil, supaya string CSV tidak dibangun ulang
+# (dan ditahan di memori) pada setiap rerun
+@st.cache_data
+def to_csv_bytes(hasil: pd.DataFrame) -> bytes:
+    return hasil.to_csv(index=False).encode('utf-8')
+
+# === Render grafik (di-cache sebagai PNG) ===
+# Kunci cache = data yang diplot, jadi query berulang tidak membangun ulang
+# figure matplotlib yang mahal
+@st.cache_data
+def render_qty_chart(suppliers: tuple, quantities: tuple) -> bytes:
+    # barh menggambar dari bawah ke atas, jadi urut naik = bar terbesar di atas
+    data = pd.DataFrame({'Supplier': suppliers, 'Total_Quantity': quantities})
+    data = data.sort_values('Total_Quantity', ascending=True)
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.barh(data['Supplier'], data['Total_Quantity'], color='#1f77b4')
+    ax.set_xlabel("Total Quantity")
+    ax.set_ylabel("Supplier")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
+    # Lepas figure dari registry global pyplot agar tidak menumpuk antar-run
+    plt.close(fig)
+    return buf.getvalue()
+
+@st.cache_data
+def render_defect_chart(suppliers: tuple, defect_rates: tuple) -> bytes:
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.plot(range(len(suppliers)), defect_rates, marker="o", color="#E91E63")
+    ax.set_ylabel("Defect Rate (%)")
+    ax.set_xticks(range(len(suppliers)))
+    ax.set_xticklabels(suppliers, rotation=45, ha="right")
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100)
+    plt.close(fig)
+    return buf.getvalue()
+
 # === STREAMLIT ANTARMUKA ===
 st.title("📦 Supplier Recommendation System")
 st.markdown("## Masukkan kriteria pencarian supplier:")
 
 # Layout 1 kolom untuk input
-item_categories = ["All"] + sorted(df['Item_Category'].dropna().unique().tolist())
 item_category = st.selectbox("📁 Pilih kategori barang:", item_categories,
                              help="Pilih kategori barang yang ingin dicari. Pilih 'All' untuk semua kategori.")
 
@@ -154,26 +392,30 @@ if st.button("🔍 Cari Supplier"):
             if alternatif.empty:
                 st.info("⚠️ Tidak ada alternatif yang cukup mendekati.")
             else:
-                def alasan(row):
-                    alasan_list = []
-                    if abs(row['Defect_Rate (%)'] - max_defect_rate) <= 2:
-                        alasan_list.append(f"Defect Rate mendekati batas ({row['Defect_Rate (%)']:.1f}%)")
-                    elif row['Defect_Rate (%)'] > max_defect_rate:
-                        alasan_list.append(f"Defect Rate {row['Defect_Rate (%)']:.1f}%")
-                    if row['Avg_Negotiated_Price'] > max_price:
-                        alasan_list.append(f"Harga {int(row['Avg_Negotiated_Price']):,} > {int(max_price):,}")
-                    if row['Lead_Time'] > max_lead_time:
-                        alasan_list.append(f"Lead Time {row['Lead_Time']} hari")
-                    return ", ".join(alasan_list)
-
-                alternatif['Catatan'] = alternatif.apply(alasan, axis=1)
+                # Susun alasan per kolom secara vectorized, bukan apply per baris
+                dr = alternatif['Defect_Rate (%)']
+                dr_txt = dr.map("{:.1f}".format)
+                m_near = (dr - max_defect_rate).abs() <= 2
+                m_over = ~m_near & (dr > max_defect_rate)
+                m_price = alternatif['Avg_Negotiated_Price'] > max_price
+                m_lead = alternatif['Lead_Time'] > max_lead_time
+
+                parts = [
+                    np.where(m_near, "Defect Rate mendekati batas (" + dr_txt + "%)",
+                             np.where(m_over, "Defect Rate " + dr_txt + "%", "")),
+                    np.where(m_price,
+                             "Harga " + alternatif['Avg_Negotiated_Price'].astype(int).map("{:,}".format)
+                             + f" > {int(max_price):,}", ""),
+                    np.where(m_lead, "Lead Time " + alternatif['Lead_Time'].astype(str) + " hari", ""),
+                ]
+                alternatif['Catatan'] = [", ".join(filter(None, t)) for t in zip(*parts)]
                 st.dataframe(alternatif[['Supplier', 'Avg_Negotiated_Price', 'Lead_Time', 'Defect_Rate (%)', 'Catatan']], use_container_width=True)
 
     else:
         st.success("✅ Supplier yang direkomendasikan:")
         st.dataframe(hasil, use_container_width=True)
 
-        csv_data = hasil.to_csv(index=False)
+        csv_data = to_csv_bytes(hasil)
         st.download_button(
             label="⬇️ Download Hasil Rekomendasi (CSV)",
             data=csv_data,
@@ -185,30 +427,14 @@ if st.button("🔍 Cari Supplier"):
 
         if 'Supplier' in hasil.columns and 'Total_Quantity' in hasil.columns:
             st.markdown("**📦 Total Quantity per Supplier**")
-            fig_qty, ax_qty = plt.subplots(figsize=(8,4))
-            sns.barplot(
-                data=hasil.sort_values('Total_Quantity', ascending=False),
-                x='Total_Quantity',
-                y='Supplier',
-                palette="Blues_d",
-                ax=ax_qty
-            )
-            ax_qty.set_xlabel("Total Quantity")
-            ax_qty.set_ylabel("Supplier")
-            st.pyplot(fig_qty)
+            st.image(render_qty_chart(tuple(hasil['Supplier']), tuple(hasil['Total_Quantity'])))
 
         else:
             st.info("❌ Tidak ada hasil")
 
         if 'Supplier' in hasil.columns and 'Defect_Rate (%)' in hasil.columns:
             st.markdown("**📈 Rata-rata Defect Rate Tiap Supplier**")
-            fig_line, ax_line = plt.subplots(figsize=(8,4))
-            sns.lineplot(data=hasil, x='Supplier', y='Defect_Rate (%)', marker="o", ax=ax_line, color="#E91E63")
-            ax_line.set_ylabel("Defect Rate (%)")
-            ax_line.set_xticks(range(len(hasil)))
-            ax_line.set_xticklabels(hasil['Supplier'], rotation=45, ha="right")
-            fig_line.tight_layout()
-            st.pyplot(fig_line)
-        
+            st.image(render_defect_chart(tuple(hasil['Supplier']), tuple(hasil['Defect_Rate (%)'])))
+
         else:
             st.info("❌ Tidak ada hasil")
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""Konversi satu kali Data/data_supplier.csv ke Parquet.
+
+Jalankan ulang hanya jika CSV sumber berubah:
+    python convert_to_parquet.py
+"""
+import pandas as pd
+
+df = pd.read_csv(
+    "Data/data_supplier.csv",
+    parse_dates=["Order_Date", "Delivery_Date"],
+)
+df.to_parquet("Data/data_supplier.parquet", compression="snappy")
+print(f"Tersimpan Data/data_supplier.parquet ({len(df)} baris)")